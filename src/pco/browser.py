@@ -0,0 +1,139 @@
+"""
+Selenium flows for the parts of the PCO web UI that have no API (creating groups, chat, location).
+Only imported by the subcommands that open a browser.
+"""
+import os
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+def login_url():
+    """
+    Base URL of the PCO login page, overridable with PCO_LOGIN_URL (e.g. to point at a test server).
+    """
+    return os.environ.get("PCO_LOGIN_URL") or "https://login.planningcenteronline.com"
+
+def groups_url():
+    """
+    Base URL of PCO Groups, overridable with PCO_GROUPS_URL (e.g. to point at a test server).
+    """
+    return os.environ.get("PCO_GROUPS_URL") or "https://groups.planningcenteronline.com"
+
+def init_driver():
+    """
+    Initialize the Selenium WebDriver with Chrome and set the window size.
+    """
+    driver = webdriver.Chrome()
+    driver.set_window_size(1200, 1000)
+    return driver
+
+def logged_in_driver(d: webdriver.Chrome):
+    """
+    Login to Planning Center Online (PCO) using Selenium WebDriver.
+    """
+    # Login steps
+    d.get(f"{login_url()}/login/new")
+    # print(d.find_elements(By.ID, "email"), d.find_elements(By.ID, "password"))
+    d.implicitly_wait(2)
+
+    # don't re-login if already logged in
+    if len(d.find_elements(By.ID, "email")) > 0 and len(d.find_elements(By.ID, "password")) > 0:
+        d.find_element(By.ID, "email").send_keys(os.environ["PCO_EMAIL"])
+        d.find_element(By.ID, "password").send_keys(os.environ["PCO_PASSWORD"])
+        d.find_element(By.NAME, "commit").click()
+        # time.sleep(5)
+        # d.find_element(By.CSS_SELECTOR, ".pane:nth-child(2) > .btn").click()
+
+    return d
+
+def create_cg(logged_in_driver: webdriver.Chrome, group_name: str, location: str):
+    """
+    Create a new Connect Group in Planning Center Online (PCO) using Selenium WebDriver.
+
+    Args:
+        logged_in_driver (webdriver.Chrome): The logged-in Selenium WebDriver instance.
+        group_name (str): The name of the group to create.
+        location (str): The location for the group.
+    Returns:
+        webdriver.Chrome: The Selenium WebDriver instance after creating the group.
+    """
+    # save me
+    d = logged_in_driver
+
+    ### CREATE CONNECT GROUP ###
+    d.implicitly_wait(2)
+    # 1 | open | /my_groups |
+    d.get(f"{groups_url()}/groups")
+    d.implicitly_wait(10)
+    # 4 | click | xpath=//div[@id='filtered-groups-header']/div/div/div/button[2] |
+    # d.find_element(By.XPATH, "//div[@id=\'filtered-groups-header\']/div/div/div/button[2]").click()
+    d.find_element(By.CSS_SELECTOR, 'button[aria-label="Create a new group"]').click()
+    # 5 | click | id=group_group_type_id |
+    d.find_element(By.ID, "group_group_type_id").click()
+    # d.find_element(By.ID, "selectFilterGroupTypes").click()
+    # 6 | select | id=group_group_type_id | label=Connect Groups
+    dropdown = d.find_element(By.ID, "group_group_type_id")
+    # d.find_element(By.ID, "item-list-0-item-2").click()
+    dropdown.find_element(By.XPATH, "//option[. = 'Connect Groups']").click()
+    # 7 | click | id=group_name |
+    d.find_element(By.ID, "group_name").click()
+    # 8 | type | id=group_name | [TEST] Dev Selenium4
+    d.find_element(By.ID, "group_name").send_keys(str(group_name))
+
+    d.find_element(By.XPATH, "//span[contains(.,'Create group')]").click()
+    d.implicitly_wait(4)
+
+    ### ENABLE CHAT ###
+    # d.find_element(By.XPATH, "(//button[@type=\'button\'])[10]").click()
+    # d.find_element(By.LINK_TEXT, "View settings").click()
+    d.find_element(By.XPATH, "//a[contains(text(),'View settings')]").click()
+    d.implicitly_wait(2)
+
+    d.find_element(By.CSS_SELECTOR, ".btn:nth-child(4)").click()
+    d.implicitly_wait(2)
+
+    ### SET LOCATION ###
+    dropdown = d.find_element(By.CSS_SELECTOR, ".select--inline")
+    dropdown.find_element(By.XPATH, "//option[. = 'Create a new location...']").click()
+    d.implicitly_wait(2)
+
+    d.find_element(By.XPATH, "//div[2]/div/div/div/div/div/input").click()
+    d.find_element(By.XPATH, "//div[2]/div/div/div/div/div/input").send_keys(str(location))
+    d.implicitly_wait(2)
+
+    return d
+
+def create_coach_group(logged_in_driver: webdriver.Chrome, group_name: str):
+    """
+    Create a new Coach Group in Planning Center Online (PCO) using Selenium WebDriver.
+
+    Args:
+        logged_in_driver (webdriver.Chrome): The logged-in Selenium WebDriver instance.
+        group_name (str): The name of the group to create.
+    Returns:
+        webdriver.Chrome: The Selenium WebDriver instance after creating the group.
+    """
+    # save me
+    d = logged_in_driver
+
+    ### CREATE COACH GROUP ###
+    d.implicitly_wait(2)
+    # 1 | open | /my_groups |
+    d.get(f"{groups_url()}/groups")
+    d.implicitly_wait(5)
+    # 4 | click | xpath=//div[@id='filtered-groups-header']/div/div/div/button[2] |
+    # d.find_element(By.XPATH, "//div[@id=\'filtered-groups-header\']/div/div/div/button[2]").click()
+    d.find_element(By.CSS_SELECTOR, 'button[aria-label="Create a new group"]').click()
+    # 5 | click | id=group_group_type_id |
+    d.find_element(By.ID, "group_group_type_id").click()
+    # 6 | select | id=group_group_type_id | label=Connect Groups
+    dropdown = d.find_element(By.ID, "group_group_type_id")
+    dropdown.find_element(By.XPATH, "//option[. = 'Coach Group']").click()
+    # 7 | click | id=group_name |
+    d.find_element(By.ID, "group_name").click()
+    # 8 | type | id=group_name | [TEST] Dev Selenium4
+    d.find_element(By.ID, "group_name").send_keys(str(group_name))
+
+    d.find_element(By.XPATH, "//span[contains(.,'Create group')]").click()
+    d.implicitly_wait(4)
+
+    return d
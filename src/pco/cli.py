@@ -0,0 +1,43 @@
+"""
+`pco` console entry point.
+
+Subcommand modules are imported only once chosen, so e.g. `pco tag` never imports selenium or pandas.
+"""
+import argparse
+import importlib
+import os
+
+COMMANDS = {
+    # name: (module, CSV env var, supports --watch, help)
+    "create": ("pco.commands.create", "CONNECT_GROUPS_CSV", True, "Create connect groups, tag them and add leaders"),
+    "coach":  ("pco.commands.coach", "COACH_GROUPS_CSV", False, "Create coach groups and add coaches and leaders"),
+    "tag":    ("pco.commands.tag", "CONNECT_GROUPS_CSV", True, "Tag existing connect groups"),
+}
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="pco", description="Manage Planning Center groups from CSV files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (_, env_var, watchable, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        sub.add_argument("csv", nargs="?", default=os.environ.get(env_var),
+                         help=f"Path to the CSV file. Defaults to ${env_var}.")
+        if watchable:
+            sub.add_argument("--watch", action="store_true",
+                             help="Keep running and apply only rows that change in the CSV.")
+    return parser
+
+def main(argv: list = None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    module_name, env_var, _, _ = COMMANDS[args.command]
+    if not args.csv:
+        parser.error(f"no CSV given and ${env_var} is not set")
+
+    command = importlib.import_module(module_name)
+    if getattr(args, "watch", False):
+        command.watch(args.csv)
+    else:
+        command.main(args.csv)
+
+if __name__ == "__main__":
+    main()
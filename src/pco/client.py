@@ -0,0 +1,166 @@
+"""
+Shared PCO API helpers used by every `pco` subcommand.
+
+pypco is only imported when the client is first needed, and the client (and with it
+its HTTP session / connection pool) and the name -> ID lookups are shared per process.
+"""
+import os
+import datetime as dt
+from typing import TYPE_CHECKING
+from pco.utils.tags import tag_season, tag_campus, tag_group_type, tag_regularity, tag_demographics
+
+if TYPE_CHECKING:
+    from pypco import PCO
+
+_client = None
+_group_ids = {}
+_person_ids = {}
+
+def get_client():
+    """
+    Get the PCO API client for this process, creating it on first use.
+
+    Returns:
+        PCO: PCO API client authenticated with PCO_APP_ID and PCO_API_KEY.
+    """
+    global _client
+    if _client is None:
+        from pypco import PCO
+        _client = PCO(os.environ["PCO_APP_ID"], os.environ["PCO_API_KEY"])
+    return _client
+
+def forget_group(group_name: str):
+    """
+    Drop a cached group ID, e.g. after the group was removed or renamed.
+    """
+    _group_ids.pop(group_name, None)
+
+def get_group_id(pco: "PCO", group_name: str):
+    """
+    Get the group ID for a given group name via the PCO API.
+
+    Args:
+        pco (PCO): PCO API client.
+        group_name (str): The name of the group to search for.
+    Returns:
+        int: The ID of the group if found, None otherwise.
+    """
+    if group_name in _group_ids:
+        return _group_ids[group_name]
+    try:
+        data = pco.get(f'/groups/v2/groups?where[name]={group_name}')
+        print(f"Number of groups matching {group_name}: {len(data['data'])}")
+        if data['data']:
+            group_id = data['data'][0]['id']
+            _group_ids[group_name] = group_id
+            return group_id
+        else:
+            print(f"No group found with name: {group_name}")
+            return
+    except Exception as e:
+        print(f"Error fetching group ID for {group_name}: {e}")
+        return
+
+def patch_group(pco: "PCO",
+                group_id: int,
+                name: str = None,
+                tags: int | list = None,
+                schedule: str = None):
+    """
+    Patch a group with new attributes via the PCO API.
+
+    Args:
+        pco (PCO): PCO API client.
+        group_id (int): The ID of the group to patch.
+        name (str, optional): New name for the group. Defaults to None.
+        tags (int | list, optional): New tag IDs for the group. Defaults to None.
+        schedule (str, optional): New schedule for the group. Defaults to None.
+    Returns:
+        dict: The response from the API call.
+    """
+    # create payload
+    attributes = {}
+    if name:
+        attributes['name'] = name
+    if schedule:
+        attributes['schedule'] = schedule
+    if tags:
+        attributes['tag_ids'] = tags
+
+    # make API call to update group
+    response = pco.patch(f'/groups/v2/groups/{group_id}', payload={"data": {"attributes": attributes}})
+    return response
+
+def get_tag_ids(season: str, campus: str, group_type: str, regularity: str, demographics: str = None):
+    """
+    Get the tag IDs for a given season, campus, group type, regularity and demographic and return them as a list.
+
+    Args:
+        season (str): The season to tag.
+        campus (str): The campus to tag.
+        group_type (str): The group type to tag.
+        regularity (str): The regularity to tag.
+        demographics (str, optional): The demographic to tag. Defaults to None.
+    Returns:
+        list: A list of tag IDs.
+    """
+    season_tag = tag_season(season)
+    campus_tag = tag_campus(campus)
+    group_type_tag = tag_group_type(group_type)
+    regularity_tag = tag_regularity(regularity)
+    demographics_tag = tag_demographics(demographics)
+
+    tags = [season_tag, campus_tag, group_type_tag, regularity_tag, demographics_tag]
+    tags = [tag for tag in tags if tag is not None]
+    return tags
+
+def find_person(pco: "PCO", name: str):
+    """
+    Find a person by name via the PCO API.
+
+    Args:
+        pco (PCO): PCO API client.
+        name (str): The name of the person to search for.
+    Returns:
+        int: The ID of the first matching person if found, None otherwise.
+    """
+    if name in _person_ids:
+        return _person_ids[name]
+    try:
+        data = pco.get(f'/people/v2/people?where[search_name]={name}')
+        print(f"Number of people matching {name}: {len(data['data'])}")
+        if data['data']:
+            person_id = data['data'][0]['id']
+            _person_ids[name] = person_id
+            return person_id
+        else:
+            print(f"No person found with name: {name}")
+            return
+    except Exception as e:
+        print(f"Error fetching person ID for {name}: {e}")
+        return
+
+def add_member(pco: "PCO",
+               group_id: int,
+               member_id: int,
+               role: str = "leader"):
+    """
+    Add a member to a group via the PCO API.
+
+    Args:
+        pco (PCO): PCO API client.
+        group_id (int): The ID of the group to add the member to.
+        member_id (int): The person ID of the member to add.
+        role (str, optional): Membership role, "leader" or "member". Defaults to "leader".
+    Returns:
+        dict: The response from the API call.
+    """
+    now_utc = dt.datetime.now(dt.timezone.utc)
+    # create payload
+    attributes = {
+        "person_id": int(member_id),
+        "joined_at": now_utc.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "role": role
+    }
+    response = pco.post(f'/groups/v2/groups/{group_id}/memberships', payload={"data": {"attributes": attributes}})
+    return response
@@ -0,0 +1 @@
+# one module per `pco` subcommand, imported lazily by pco.cli so each only pays for its own dependencies
@@ -0,0 +1,56 @@
+"""
+`pco coach`: create a coach group per coach in the browser, then add its coaches and leaders via the API.
+"""
+import pandas as pd
+from pco.browser import init_driver, logged_in_driver, create_coach_group
+from pco.client import get_client, get_group_id, find_person, add_member
+
+def main(cg_path: str = None):
+    """
+    Create a coach group in PCO for every coach in the CSV. Run with `pco coach`.
+
+    Steps:
+    1. Initialize the Selenium WebDriver.
+    2. Login to PCO.
+    3. Create a coach group named after each coach.
+    4. Add the coach group leads to the group as leaders.
+    5. Add the coached connect group leaders to the group as members.
+    """
+    driver_init = init_driver()
+    pco = get_client()
+
+    # Read CSV file of coach groups
+    df = pd.read_csv(cg_path)
+    assert 'Coach' in df.columns, "Coach column not found in CSV"
+
+    for coach_name in df['Coach'].unique():
+        driver = logged_in_driver(driver_init)
+        driver.implicitly_wait(2)
+
+        group_name = "Fall 2025 Coach Group - " + coach_name.strip()
+        driver = create_coach_group(driver, group_name)
+        print(f"Created group: {group_name}")
+
+        df_coach = df[df['Coach'] == coach_name]
+        coaches  = df_coach['Coach_Group_Lead_1'].unique().tolist() + df_coach['Coach_Group_Lead_2'].dropna().unique().tolist()
+        leaders  = df_coach['Leader'].tolist()
+        print(coaches, leaders)
+
+
+        # Add leader to group
+        for coach in coaches:
+            member_id = find_person(pco, coach.strip())
+            if member_id:
+                add_member(pco, get_group_id(pco, group_name), member_id)
+                print(f"Added {coach} to {group_name} as leader")
+            else:
+                print(f"{coach} not found")
+
+        # Add members to group
+        for leader in leaders:
+            member_id = find_person(pco, leader.strip())
+            if member_id:
+                add_member(pco, get_group_id(pco, group_name), member_id, role="member")
+                print(f"Added {leader} to {group_name} as member")
+            else:
+                print(f"{leader} not found")
@@ -0,0 +1,156 @@
+"""
+`pco create`: create connect groups in the browser, then tag them, set their schedule and add leaders via the API.
+"""
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from pco.browser import init_driver, logged_in_driver, create_cg
+from pco.client import get_client, forget_group, get_group_id, patch_group, get_tag_ids, find_person, add_member
+from pco.utils.watch import load_rows, watch_csv
+
+if TYPE_CHECKING:
+    from pypco import PCO
+
+def get_leaders(row):
+    """
+    Get the leader names for a CSV row from the `leader` and `co-leaders` columns.
+
+    Args:
+        row (dict): A row of the connect groups CSV.
+    Returns:
+        list: Leader names with empty cells dropped.
+    """
+    leaders = []
+    if isinstance(row.get('leader'), str):
+        leaders.append(row['leader'])
+    if isinstance(row.get('co-leaders'), str):
+        leaders += row['co-leaders'].split(",")
+    return [leader.strip() for leader in leaders if leader.strip()]
+
+def update_cg(pco: "PCO", row: dict, group_id: int, leaders: list, added: set = None):
+    """
+    Tag a connect group, set its schedule and add its leaders via the PCO API.
+
+    Args:
+        pco (PCO): PCO API client.
+        row (dict): A row of the connect groups CSV.
+        group_id (int): The ID of the group to update. If None, the row is skipped.
+        leaders (list): Names of the people to add as leaders.
+        added (set, optional): Leaders already added to this group. Those are skipped, and each
+            leader added here is recorded in it, so a retry after a failure doesn't re-add anyone.
+    """
+    group_name = row['group_name'].strip()
+    if group_id is None:
+        print(f"Skipping {group_name}: no such group in PCO")
+        return
+    added = set() if added is None else added
+
+    # Get mathcing tag IDs for season/campus/group type/regularity
+    tags = get_tag_ids (season=row['season'] if 'season' in row else None,
+                        campus=row['campus'] if 'campus' in row else None,
+                        group_type=row['group_type'] if 'group_type' in row else None,
+                        regularity=row['regularity'] if 'regularity' in row else None)
+
+    # add Tags (Season, Campus, Group Type, Regularity) and Schedule here
+    patch_group(pco,
+                group_id=group_id,
+                tags=tags,
+                schedule=row['schedule'] if 'schedule' in row else None,)
+
+    # Add members to group
+    for leader_name in leaders:
+        if leader_name in added:
+            continue
+        member_id = find_person(pco, leader_name)
+        if member_id:
+            add_member(pco, group_id, member_id)
+            added.add(leader_name)
+            print(f"Added {leader_name} to {group_name} as leader")
+        else:
+            print(f"{leader_name} not found")
+
+def main(cg_path: str = None):
+    """
+    Create connect groups in PCO for every row of the CSV. Run with `pco create`.
+
+    Steps:
+    1. Initialize the Selenium WebDriver.
+    2. Login to PCO.
+    3. Create connect group with name, location, and enable chat.
+    4. Update group attributes of season, campus, group type, regularity, and schedule.
+    5. Add one leader to the group. (for now, only one leader is supported)
+    """
+    driver_init = init_driver()
+    pco = get_client()
+
+    # Read CSV file of connect groups
+    rows = load_rows(cg_path, key='group_name')
+
+    for row in rows:
+        group_name = (row['group_name'] or '').strip()
+        if not group_name:
+            print(f"Skipping row without a group_name: {row}")
+            continue
+
+        driver = logged_in_driver(driver_init)
+        driver.implicitly_wait(2)
+
+        # group_name = "Summer 2025 CG - " + group_name
+        location   = row['location'] if 'location' in row else None
+        driver = create_cg(driver, group_name, location)
+        print(f"Created group: {group_name}")
+
+        update_cg(pco, row, get_group_id(pco, group_name), get_leaders(row))
+
+def watch(cg_path: str = None):
+    """
+    Keep the browser and API client open and apply only the rows that change in the CSV.
+    Run with `pco create --watch`.
+
+    Added rows are created like in `main`, unless a group with that name already exists, in
+    which case only its tags and schedule are updated. Changed rows are re-tagged, get their
+    schedule updated and have any newly listed leaders added. Rows whose group isn't in PCO are
+    skipped. Removed rows are reported but the groups are left in PCO. Run `pco create` once
+    first, since the CSV as it is when watching starts is taken as already applied.
+
+    If a row fails partway, `watch_csv` retries it; groups this process created and leaders it
+    already added are remembered, so the retry picks up where the last attempt stopped.
+    """
+    driver_init = init_driver()
+    pco = get_client()
+    # groups created by this process, and the leaders added to each so far
+    created = set()
+    added_leaders = defaultdict(set)
+
+    def on_change(added: dict, changed: dict, removed: dict):
+        for group_name, row in added.items():
+            group_id = get_group_id(pco, group_name)
+            if group_name not in created:
+                if group_id:
+                    # a row can reappear (cut and pasted back, or a short read), don't create it twice
+                    print(f"{group_name} already exists, updating tags and schedule only")
+                    update_cg(pco, row, group_id, [])
+                    continue
+
+                driver = logged_in_driver(driver_init)
+                driver = create_cg(driver, group_name, row.get('location'))
+                created.add(group_name)
+                print(f"Created group: {group_name}")
+                group_id = get_group_id(pco, group_name)
+
+            if group_id is None:
+                raise RuntimeError(f"{group_name} was created but isn't visible in the API yet")
+            update_cg(pco, row, group_id, get_leaders(row), added_leaders[group_name])
+
+        for group_name, (old_row, row) in changed.items():
+            print(f"Updating group: {group_name}")
+            if old_row.get('location') != row.get('location'):
+                print(f"Location of {group_name} changed, update it in PCO by hand")
+            old_leaders = get_leaders(old_row)
+            new_leaders = [leader for leader in get_leaders(row) if leader not in old_leaders]
+            update_cg(pco, row, get_group_id(pco, group_name), new_leaders, added_leaders[group_name])
+
+        for group_name in removed:
+            forget_group(group_name)
+            print(f"{group_name} was removed from the CSV, leaving it in PCO")
+
+    watch_csv(cg_path, on_change, key='group_name')
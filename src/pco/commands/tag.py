@@ -0,0 +1,70 @@
+"""
+`pco tag`: tag existing connect groups via the API. Needs neither a browser nor pandas.
+"""
+from typing import TYPE_CHECKING
+from pco.client import get_client, get_group_id, patch_group, get_tag_ids
+from pco.utils.watch import load_rows, watch_csv
+
+if TYPE_CHECKING:
+    from pypco import PCO
+
+def main(cg_path: str = None):
+    """
+    Tag the connect group for every row of the CSV. Run with `pco tag`.
+    """
+    pco = get_client()
+
+    # Read CSV file of connect groups
+    rows = load_rows(cg_path, key='group_name')
+
+    for i, row in enumerate(rows, start=1):
+        print(f"[{i}/{len(rows)}]", end=" ")
+        if not (row['group_name'] or '').strip():
+            print(f"Skipping row without a group_name: {row}")
+            continue
+        tag_row(pco, row)
+
+def tag_row(pco: "PCO", row: dict):
+    """
+    Tag the group for a CSV row with its season, campus, group type, regularity and demographic.
+
+    Args:
+        pco (PCO): PCO API client.
+        row (dict): A row of the connect groups CSV.
+    """
+    group_name = row['group_name']
+    group_name = "Summer 2025 CG - " + group_name
+    print(f"Updating group: {group_name}")
+
+    # Get mathcing tag IDs for season/campus/group type/regularity
+    tags = get_tag_ids (season=row['season'] if 'season' in row else None,
+                        campus=row['campus'] if 'campus' in row else None,
+                        group_type=row['group_type'] if 'group_type' in row else None,
+                        regularity=row['regularity'] if 'regularity' in row else None,
+                        demographics=row['demographic'] if 'demographic' in row else None)
+
+    group_id = get_group_id(pco, group_name)
+    if group_id is None:
+        print(f"Skipping {group_name}: no such group in PCO")
+        return
+
+    # add Tags (Season, Campus, Group Type, Regularity) and Schedule here
+    patch_group(pco,
+                group_id=group_id,
+                tags=tags,)
+                # schedule=row['schedule'] if 'schedule' in row else None,)
+
+def watch(cg_path: str = None):
+    """
+    Keep the API client open and re-tag only the rows that are added or changed in the CSV.
+    Run with `pco tag --watch`, after `pco tag` once, since the CSV as it is when watching starts is taken as already applied.
+    """
+    pco = get_client()
+
+    def on_change(added: dict, changed: dict, removed: dict):
+        for row in added.values():
+            tag_row(pco, row)
+        for _, row in changed.values():
+            tag_row(pco, row)
+
+    watch_csv(cg_path, on_change, key='group_name')
@@ -0,0 +1,45 @@
+import pytest
+
+from fake_pco import FakePCO
+
+@pytest.fixture(scope="session")
+def fake_pco():
+  # one server per worker process (pytest-xdist), so workers never share state
+  app = FakePCO().start()
+  # point the production flows in pco.browser at the fake, with throwaway credentials
+  with pytest.MonkeyPatch.context() as mp:
+    mp.setenv("PCO_LOGIN_URL", app.base_url)
+    mp.setenv("PCO_GROUPS_URL", app.base_url)
+    mp.setenv("PCO_EMAIL", "test@example.com")
+    mp.setenv("PCO_PASSWORD", "password")
+    yield app
+  app.stop()
+
+@pytest.fixture(scope="session")
+def driver():
+  webdriver = pytest.importorskip("selenium.webdriver")
+  options = webdriver.ChromeOptions()
+  options.add_argument("--headless=new")
+  options.add_argument("--no-sandbox")
+  options.add_argument("--disable-dev-shm-usage")
+  driver = webdriver.Chrome(options=options)
+  driver.set_window_size(1200, 1000)
+  yield driver
+  driver.quit()
+
+@pytest.fixture
+def logged_in_driver(driver, fake_pco):
+  from pco.browser import logged_in_driver
+  yield logged_in_driver(driver)
+
+def pytest_terminal_summary(terminalreporter):
+  # flow timings are recorded via `record_property`, which also survives the trip back from xdist workers
+  timings = [(report.nodeid, dict(report.user_properties)["flow_seconds"])
+             for report in terminalreporter.stats.get("passed", [])
+             if report.when == "call" and "flow_seconds" in dict(report.user_properties)]
+  if not timings:
+    return
+  terminalreporter.section("flow timings")
+  for nodeid, seconds in sorted(timings, key=lambda t: t[1], reverse=True):
+    terminalreporter.write_line(f"{seconds:8.3f}s  {nodeid}")
+  terminalreporter.write_line(f"{sum(seconds for _, seconds in timings):8.3f}s  total")
@@ -0,0 +1,236 @@
+"""
+A tiny local stand-in for the parts of the PCO web UI our Selenium flows touch:
+login, the groups list with the "Create a new group" modal, group settings (chat)
+and the location picker. The markup only mirrors the ids, classes and XPaths the
+flows rely on, so they can be benchmarked and regression-tested offline.
+
+Run it standalone with `python src/pco/tests/fake_pco.py --port 8000`.
+"""
+import argparse
+import html
+import itertools
+import re
+import threading
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlsplit
+
+GROUP_TYPES = ["Connect Groups", "Coach Group"]
+
+PAGE = Template("""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>$title - Fake PCO</title></head>
+<body>$body</body></html>""")
+
+LOGIN = """
+<form method="post" action="/login">
+  <input id="email" name="email" type="email">
+  <input id="password" name="password" type="password">
+  <input name="commit" type="submit" value="Log in">
+</form>"""
+
+GROUPS = Template("""
+<div id="filtered-groups-header">
+  <div><div><div>
+    <button type="button">Filter</button>
+    <button type="button" aria-label="Create a new group"
+            onclick="document.getElementById('new-group-modal').hidden = false">+</button>
+  </div></div></div>
+</div>
+<ul id="groups">$groups</ul>
+<div id="new-group-modal" hidden>
+  <form method="post" action="/groups">
+    <select id="group_group_type_id" name="group_type">$options</select>
+    <input id="group_name" name="name" type="text">
+    <button type="submit"><span>Create group</span></button>
+  </form>
+</div>""")
+
+GROUP = Template("""
+<h1 id="group-name">$name</h1>
+<a href="/groups/$id/settings">View settings</a>""")
+
+SETTINGS = Template("""
+<div class="header">
+  <h1>$name</h1>
+  <div class="toolbar">
+    <a class="btn" href="/groups/$id">Overview</a>
+    <a class="btn" href="/groups/$id/members">Members</a>
+    <a class="btn" href="/groups/$id/events">Events</a>
+    <button class="btn" type="button" id="chat-toggle" onclick="toggleChat(this)">$chat</button>
+  </div>
+</div>
+<div class="location">
+  <select class="select--inline"
+          onchange="document.getElementById('new-location').hidden = this.value !== 'new'">
+    <option value="">No location</option>
+    <option value="new">Create a new location...</option>
+  </select>
+  <div id="new-location" hidden><div><div><div><div>
+    <input name="location" type="text" oninput="saveLocation(this)">
+  </div></div></div></div></div>
+</div>
+<script>
+  // the flow never leaves the location input, so save it as it is typed; seq lets the server drop stale requests
+  let locationSeq = 0;
+  function toggleChat(button) {
+    fetch('/groups/$id/chat', {method: 'POST'}).then(r => r.text()).then(text => button.textContent = text);
+  }
+  function saveLocation(input) {
+    fetch('/groups/$id/location', {method: 'POST', body: new URLSearchParams({location: input.value, seq: ++locationSeq})});
+  }
+</script>""")
+
+
+class FakePCO:
+  """
+  In-memory fake of the PCO groups web UI served over HTTP on localhost.
+
+  Args:
+      host (str, optional): Interface to bind to. Defaults to "127.0.0.1".
+      port (int, optional): Port to bind to; 0 picks a free one. Defaults to 0.
+  """
+  def __init__(self, host: str = "127.0.0.1", port: int = 0):
+    self.groups = {}
+    self._ids = itertools.count(1)
+    self._lock = threading.Lock()
+    self._server = ThreadingHTTPServer((host, port), _handler(self))
+    self._server.daemon_threads = True
+    self._thread = None
+
+  @property
+  def base_url(self):
+    host, port = self._server.server_address[:2]
+    return f"http://{host}:{port}"
+
+  def create_group(self, name: str, group_type: str):
+    with self._lock:
+      group_id = next(self._ids)
+      self.groups[group_id] = {"name": name, "group_type": group_type, "chat": False,
+                               "location": None, "location_seq": 0}
+    return group_id
+
+  def find_group(self, name: str):
+    """
+    Return the first group with the given name, or None.
+    """
+    return next((g for g in self.groups.values() if g["name"] == name), None)
+
+  def start(self):
+    self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self):
+    self._server.shutdown()
+    self._server.server_close()
+
+
+def _handler(app: FakePCO):
+  class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+      pass
+
+    def _logged_in(self):
+      jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+      return "session" in jar
+
+    def _form(self):
+      length = int(self.headers.get("Content-Length", 0))
+      data = parse_qs(self.rfile.read(length).decode())
+      return {k: v[0] for k, v in data.items()}
+
+    def _send(self, title: str, body: str, status: int = 200):
+      payload = PAGE.substitute(title=html.escape(title), body=body).encode()
+      self.send_response(status)
+      self.send_header("Content-Type", "text/html; charset=utf-8")
+      self.send_header("Content-Length", str(len(payload)))
+      self.end_headers()
+      self.wfile.write(payload)
+
+    def _text(self, text: str):
+      payload = text.encode()
+      self.send_response(200)
+      self.send_header("Content-Type", "text/plain; charset=utf-8")
+      self.send_header("Content-Length", str(len(payload)))
+      self.end_headers()
+      self.wfile.write(payload)
+
+    def _redirect(self, location: str, cookie: str = None):
+      self.send_response(303)
+      self.send_header("Location", location)
+      if cookie:
+        self.send_header("Set-Cookie", cookie)
+      self.send_header("Content-Length", "0")
+      self.end_headers()
+
+    def _group(self, path: str):
+      match = re.fullmatch(r"/groups/(\d+)(/\w+)?", path)
+      if match and int(match[1]) in app.groups:
+        return int(match[1]), app.groups[int(match[1])], match[2]
+      return None, None, None
+
+    def do_GET(self):
+      path = urlsplit(self.path).path
+      if path == "/login/new":
+        if self._logged_in():
+          return self._redirect("/groups")
+        return self._send("Log in", LOGIN)
+      if not self._logged_in():
+        return self._redirect("/login/new")
+      if path == "/groups":
+        groups = "".join(f'<li><a href="/groups/{i}">{html.escape(g["name"])}</a></li>'
+                         for i, g in app.groups.items())
+        options = "".join(f"<option>{t}</option>" for t in GROUP_TYPES)
+        return self._send("Groups", GROUPS.substitute(groups=groups, options=options))
+
+      group_id, group, page = self._group(path)
+      if group is None:
+        return self._send("Not found", "<h1>Not found</h1>", status=404)
+      fields = {"id": group_id, "name": html.escape(group["name"]),
+                "chat": "Disable chat" if group["chat"] else "Enable chat"}
+      if page == "/settings":
+        return self._send("Settings", SETTINGS.substitute(fields))
+      return self._send(group["name"], GROUP.substitute(fields))
+
+    def do_POST(self):
+      path = urlsplit(self.path).path
+      form = self._form()
+      if path == "/login":
+        if form.get("email") and form.get("password"):
+          return self._redirect("/groups", cookie="session=1; Path=/")
+        return self._redirect("/login/new")
+      if not self._logged_in():
+        return self._redirect("/login/new")
+      if path == "/groups":
+        group_id = app.create_group(form.get("name", ""), form.get("group_type"))
+        return self._redirect(f"/groups/{group_id}")
+
+      group_id, group, page = self._group(path)
+      if page == "/chat":
+        with app._lock:
+          group["chat"] = not group["chat"]
+        return self._text("Disable chat" if group["chat"] else "Enable chat")
+      if page == "/location":
+        with app._lock:
+          seq = int(form.get("seq", 0))
+          if seq > group["location_seq"]:
+            group["location"], group["location_seq"] = form.get("location"), seq
+        return self._text("")
+      return self._send("Not found", "<h1>Not found</h1>", status=404)
+
+  return Handler
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Serve a fake PCO web UI for Selenium tests.")
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=8000)
+  args = parser.parse_args()
+
+  app = FakePCO(args.host, args.port)
+  print(f"Fake PCO running at {app.base_url}")
+  try:
+    app._server.serve_forever()
+  except KeyboardInterrupt:
+    app.stop()
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+import pytest
+from pco.cli import build_parser
+
+def test_parse_subcommands():
+  parser = build_parser()
+  args = parser.parse_args(["create", "groups.csv", "--watch"])
+  assert (args.command, args.csv, args.watch) == ("create", "groups.csv", True)
+  assert parser.parse_args(["coach", "coaches.csv"]).csv == "coaches.csv"
+  with pytest.raises(SystemExit):
+    parser.parse_args(["coach", "coaches.csv", "--watch"])
+
+def test_tag_does_not_import_heavy_dependencies():
+  # run in a fresh interpreter so modules imported by other tests don't count
+  code = ("import sys, pco.cli, pco.commands.tag; "
+          "print(sorted({m.split('.')[0] for m in sys.modules} & {'pandas', 'selenium', 'tqdm', 'pypco'}))")
+  out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+  assert out.strip() == "[]"
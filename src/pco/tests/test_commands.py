@@ -0,0 +1,133 @@
+import importlib
+import itertools
+import sys
+import types
+import pytest
+import pco.client
+
+class StubPCO:
+  """
+  Just enough of pypco's PCO for the group, people and membership calls in pco.client.
+  The first membership POST for each person in `flaky` fails, like a transient 5xx.
+  """
+  def __init__(self, groups: dict = None, people: dict = None, flaky: set = ()):
+    self.groups = dict(groups or {})
+    self.people = dict(people or {})
+    self.flaky = set(flaky)
+    self.patches = []
+    self.members = []
+    self._ids = itertools.count(100)
+
+  def create_group(self, name: str):
+    self.groups[name] = next(self._ids)
+
+  def get(self, url: str):
+    name = url.split("]=", 1)[1]
+    table = self.groups if url.startswith("/groups/") else self.people
+    return {"data": [{"id": table[name]}] if name in table else []}
+
+  def patch(self, url: str, payload: dict):
+    self.patches.append(url)
+
+  def post(self, url: str, payload: dict):
+    person_id = payload["data"]["attributes"]["person_id"]
+    if person_id in self.flaky:
+      self.flaky.discard(person_id)
+      raise RuntimeError("502 Bad Gateway")
+    self.members.append((url.split("/")[-2], person_id))
+
+@pytest.fixture
+def stub(monkeypatch):
+  stub = StubPCO(people={"Bob": 1, "Al": 2, "Cy": 3})
+  monkeypatch.setattr(pco.client, "_client", stub)
+  monkeypatch.setattr(pco.client, "_group_ids", {})
+  monkeypatch.setattr(pco.client, "_person_ids", {})
+  return stub
+
+@pytest.fixture
+def created(stub, monkeypatch):
+  # stand in for pco.browser so these tests need neither selenium nor Chrome
+  created = []
+  browser = types.ModuleType("pco.browser")
+  browser.init_driver = lambda: None
+  browser.logged_in_driver = lambda d: d
+  def create_cg(d, group_name, location):
+    created.append(group_name)
+    stub.create_group(group_name)
+  browser.create_cg = create_cg
+  monkeypatch.setitem(sys.modules, "pco.browser", browser)
+  return created
+
+def on_change_for(command: str, monkeypatch):
+  """
+  Run `pco.commands.<command>.watch` and return the callback it hands to watch_csv.
+  """
+  monkeypatch.delitem(sys.modules, f"pco.commands.{command}", raising=False)
+  module = importlib.import_module(f"pco.commands.{command}")
+  callbacks = []
+  monkeypatch.setattr(module, "watch_csv", lambda path, on_change, key: callbacks.append(on_change))
+  module.watch("groups.csv")
+  return callbacks[0]
+
+ROW = {"group_name": "NewGroup", "season": "Fall", "leader": "Bob", "co-leaders": "Al"}
+
+def test_create_retry_resumes_leaders(stub, created, monkeypatch):
+  on_change = on_change_for("create", monkeypatch)
+  stub.flaky = {2}
+
+  # Bob is added, then Al's membership POST fails; watch_csv would retry the row
+  with pytest.raises(RuntimeError):
+    on_change({"NewGroup": ROW}, {}, {})
+  on_change({"NewGroup": ROW}, {}, {})
+
+  assert created == ["NewGroup"]
+  assert stub.members == [("100", 1), ("100", 2)]
+
+def test_create_existing_group_only_updates_tags(stub, created, monkeypatch):
+  stub.groups["NewGroup"] = 10
+  on_change = on_change_for("create", monkeypatch)
+
+  on_change({"NewGroup": ROW}, {}, {})
+
+  assert created == []
+  assert stub.patches == ["/groups/v2/groups/10"]
+  assert stub.members == []
+
+def test_create_changed_row_adds_only_new_leaders(stub, created, monkeypatch):
+  stub.groups["NewGroup"] = 10
+  on_change = on_change_for("create", monkeypatch)
+
+  on_change({}, {"NewGroup": (ROW, {**ROW, "co-leaders": "Al, Cy"})}, {})
+
+  assert stub.members == [("10", 3)]
+
+def test_create_changed_row_retry_does_not_re_add_leaders(stub, created, monkeypatch):
+  stub.groups["NewGroup"] = 10
+  stub.flaky = {3}
+  on_change = on_change_for("create", monkeypatch)
+  change = ({**ROW, "co-leaders": ""}, {**ROW, "co-leaders": "Al, Cy"})
+
+  # Al is added, then Cy's membership POST fails
+  with pytest.raises(RuntimeError):
+    on_change({}, {"NewGroup": change}, {})
+  on_change({}, {"NewGroup": change}, {})
+
+  assert stub.members == [("10", 2), ("10", 3)]
+
+def test_create_changed_row_for_missing_group_is_skipped(stub, created, monkeypatch):
+  on_change = on_change_for("create", monkeypatch)
+  row = {**ROW, "group_name": "Missing"}
+
+  on_change({}, {"Missing": (row, {**row, "season": "Winter"})}, {})
+
+  assert stub.patches == []
+  assert stub.members == []
+
+def test_tag_missing_group_is_skipped(stub, monkeypatch):
+  stub.groups["Summer 2025 CG - Present"] = 7
+  on_change = on_change_for("tag", monkeypatch)
+
+  on_change({"Missing": {"group_name": "Missing", "season": "Fall"}}, {}, {})
+  on_change({}, {"Present": ({"group_name": "Present"}, {"group_name": "Present", "season": "Fall"})}, {})
+
+  assert stub.patches == ["/groups/v2/groups/7"]
@@ -1,54 +1,40 @@
+import time
 import pytest
-import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 
-@pytest.fixture(scope="session")
-def driver():
-  driver = webdriver.Chrome()
-  driver.set_window_size(500, 500)
-  yield driver
-  # driver.quit()
+pytest.importorskip("selenium")
+from pco.browser import create_cg, create_coach_group
 
-@pytest.fixture
-def logged_in_driver(driver):
-  # Login steps
-  driver.get("https://login.planningcenteronline.com/login/new")
-  # print(driver.find_elements(By.ID, "email"), driver.find_elements(By.ID, "password"))
-  driver.implicitly_wait(2)
-
-  # don't re-login if already logged in
-  if len(driver.find_elements(By.ID, "email")) > 0 and len(driver.find_elements(By.ID, "password")) > 0:
-    driver.find_element(By.ID, "email").send_keys(os.environ("PCO_EMAIL")) 
-    driver.find_element(By.ID, "password").send_keys(os.environ("PCO_PASSWORD"))
-    driver.find_element(By.NAME, "commit").click()
-    driver.find_element(By.CSS_SELECTOR, ".pane:nth-child(2) > .btn").click()
-  
-  yield driver
+def wait_for(predicate, timeout: float = 5):
+  # the fake saves chat and location with fetch(), so give those requests a moment to land
+  deadline = time.monotonic() + timeout
+  while not predicate():
+    assert time.monotonic() < deadline, "timed out waiting for the fake PCO"
+    time.sleep(0.05)
 
 @pytest.mark.parametrize("group_name", [
   '[TEST] Selenium ABC',
   '[TEST] Selenium BCA',
   '[TEST] Selenium CAB'
 ])
-def test_create_cg(logged_in_driver, group_name):
-  driver = logged_in_driver
-  
-  driver.implicitly_wait(2)
-  # 1 | open | /my_groups | 
-  driver.get("https://groups.planningcenteronline.com/groups")
-  driver.implicitly_wait(5)
-  # 4 | click | xpath=//div[@id='filtered-groups-header']/div/div/div/button[2] | 
-  driver.find_element(By.XPATH, "//div[@id=\'filtered-groups-header\']/div/div/div/button[2]").click()
-  # 5 | click | id=group_group_type_id | 
-  driver.find_element(By.ID, "group_group_type_id").click()
-  # 6 | select | id=group_group_type_id | label=Connect Groups
-  dropdown = driver.find_element(By.ID, "group_group_type_id")
-  dropdown.find_element(By.XPATH, "//option[. = 'Connect Groups']").click()
-  # 7 | click | id=group_name | 
-  driver.find_element(By.ID, "group_name").click()
-  # 8 | type | id=group_name | [TEST] Dev Selenium4
-  driver.find_element(By.ID, "group_name").send_keys(str(group_name))
+def test_create_cg(logged_in_driver, fake_pco, record_property, group_name):
+  start = time.perf_counter()
+  create_cg(logged_in_driver, group_name, "Yorkdale")
+  record_property("flow_seconds", time.perf_counter() - start)
+
+  group = fake_pco.find_group(group_name)
+  assert group is not None
+  assert group["group_type"] == "Connect Groups"
+  wait_for(lambda: group["chat"] and group["location"] == "Yorkdale")
+
+@pytest.mark.parametrize("group_name", [
+  '[TEST] Fall 2025 Coach Group - Selenium',
+])
+def test_create_coach_group(logged_in_driver, fake_pco, record_property, group_name):
+  start = time.perf_counter()
+  create_coach_group(logged_in_driver, group_name)
+  record_property("flow_seconds", time.perf_counter() - start)
 
-  driver.find_element(By.XPATH, "//span[contains(.,'Create group')]").click()
-  driver.implicitly_wait(2)
\ No newline at end of file
+  wait_for(lambda: fake_pco.find_group(group_name) is not None)
+  group = fake_pco.find_group(group_name)
+  assert group["group_type"] == "Coach Group"
+  assert not group["chat"]
@@ -0,0 +1,133 @@
+import pytest
+from pco.utils import watch
+from pco.utils.watch import diff_rows, load_rows, read_rows, row_hash
+
+CSV = """group_name,season,campus,leader
+[TEST] Group A,Summer,Midtown,Sejin Kim
+[TEST] Group B,Summer,Downtown,Oladayo Ogunnoiki
+"""
+
+def test_row_hash_changes_with_content():
+  row = {"group_name": "[TEST] Group A", "campus": "Midtown"}
+  assert row_hash(row) == row_hash(dict(reversed(row.items())))
+  assert row_hash(row) != row_hash({**row, "campus": "Downtown"})
+
+def test_read_rows_keys_by_stripped_group_name(tmp_path):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV + " [TEST] Group C ,Fall,Hamilton,\n,Fall,Hamilton,\n")
+
+  rows = read_rows(path)
+  assert list(rows) == ["[TEST] Group A", "[TEST] Group B", "[TEST] Group C"]
+  assert rows["[TEST] Group B"]["leader"] == "Oladayo Ogunnoiki"
+
+def test_diff_rows(tmp_path):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  old = read_rows(path)
+
+  path.write_text(CSV.replace("Downtown", "Hamilton").replace("[TEST] Group A", "[TEST] Group C"))
+  added, changed, removed = diff_rows(old, read_rows(path))
+
+  assert list(added) == ["[TEST] Group C"]
+  assert list(removed) == ["[TEST] Group A"]
+  old_row, new_row = changed["[TEST] Group B"]
+  assert (old_row["campus"], new_row["campus"]) == ("Downtown", "Hamilton")
+
+def test_diff_rows_ignores_reordering(tmp_path):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  old = read_rows(path)
+
+  header, *lines = CSV.splitlines()
+  path.write_text("\n".join([header, *reversed(lines)]) + "\n")
+  assert diff_rows(old, read_rows(path)) == ({}, {}, {})
+
+def test_diff_rows_with_extra_cells(tmp_path):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  old = read_rows(path)
+
+  # unquoted comma in the leader cell
+  path.write_text(CSV.replace("Oladayo Ogunnoiki", "Oladayo Ogunnoiki, Sejin Kim"))
+  new = read_rows(path)
+  assert new["[TEST] Group B"]["_extra"] == [" Sejin Kim"]
+
+  added, changed, removed = diff_rows(old, new)
+  assert list(changed) == ["[TEST] Group B"]
+
+def test_watch_csv_retries_failed_rows(tmp_path, monkeypatch):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  ticks = []
+
+  def fake_sleep(_):
+    ticks.append(None)
+    if len(ticks) == 1:
+      path.write_text(CSV.replace("Downtown", "Midtown"))
+    assert len(ticks) < 20, "watch_csv never retried"
+
+  calls = []
+  def on_change(added, changed, removed):
+    calls.append(list(changed))
+    if len(calls) == 1:
+      raise RuntimeError("API is down")
+    raise KeyboardInterrupt  # stop watching once the retry happened
+
+  monkeypatch.setattr(watch.time, "sleep", fake_sleep)
+  with pytest.raises(KeyboardInterrupt):
+    watch.watch_csv(path, on_change, interval=0)
+  assert calls == [["[TEST] Group B"], ["[TEST] Group B"]]
+
+def test_load_rows_keeps_every_row(tmp_path):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV + "[TEST] Group A,Fall,Hamilton,\n,Fall,Hamilton,\n")
+
+  assert [row["group_name"] for row in load_rows(path)] == \
+    ["[TEST] Group A", "[TEST] Group B", "[TEST] Group A", ""]
+  assert read_rows(path)["[TEST] Group A"]["season"] == "Fall"
+
+def test_watch_csv_gives_up_after_retries(tmp_path, monkeypatch):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  ticks = []
+
+  def fake_sleep(_):
+    ticks.append(None)
+    if len(ticks) == 1:
+      path.write_text(CSV.replace("Downtown", "Midtown"))
+    if len(ticks) == 30:
+      raise KeyboardInterrupt
+
+  calls = []
+  def on_change(added, changed, removed):
+    calls.append(list(changed))
+    raise RuntimeError("404 Not Found")
+
+  monkeypatch.setattr(watch.time, "sleep", fake_sleep)
+  with pytest.raises(KeyboardInterrupt):
+    watch.watch_csv(path, on_change, interval=0, retries=3)
+  assert calls == [["[TEST] Group B"]] * 3
+
+def test_watch_csv_backs_off_between_retries(tmp_path, monkeypatch):
+  path = tmp_path / "groups.csv"
+  path.write_text(CSV)
+  clock = [0.0]
+
+  def fake_sleep(seconds):
+    clock[0] += seconds
+    if clock[0] == 1:
+      path.write_text(CSV.replace("Downtown", "Midtown"))
+    if clock[0] >= 30:
+      raise KeyboardInterrupt
+
+  calls = []
+  def on_change(added, changed, removed):
+    calls.append(clock[0])
+    raise RuntimeError("503 Service Unavailable")
+
+  monkeypatch.setattr(watch.time, "sleep", fake_sleep)
+  monkeypatch.setattr(watch.time, "monotonic", lambda: clock[0])
+  with pytest.raises(KeyboardInterrupt):
+    watch.watch_csv(path, on_change, interval=1, retries=5)
+  # read once the save settles at t=2, then retried after 2s, 4s and 8s; the next one is past t=30
+  assert calls == [2, 4, 8, 16]
@@ -0,0 +1,167 @@
+import csv
+import hashlib
+import json
+import os
+import time
+
+def row_hash(row: dict):
+    """
+    Get a stable content hash for a CSV row.
+
+    Args:
+        row (dict): The row as a mapping of column name to value.
+    Returns:
+        str: A hex digest that only changes when a cell in the row changes.
+    """
+    # keys are stringified so stray cells (see `read_rows`) can't break the sort
+    payload = json.dumps(sorted((str(k), v) for k, v in row.items()), default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+def load_rows(path: str, key: str = "group_name"):
+    """
+    Read every row of a CSV file, in order.
+
+    Args:
+        path (str): Path to the CSV file.
+        key (str, optional): Column that must be present. Defaults to "group_name".
+    Returns:
+        list: The rows (dict). Cells beyond the header (e.g. from an unquoted comma) are kept
+        as a list under "_extra".
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f, restkey="_extra")
+        assert reader.fieldnames and key in reader.fieldnames, f"{key} column not found in CSV"
+        return list(reader)
+
+def read_rows(path: str, key: str = "group_name"):
+    """
+    Read a CSV file into rows keyed by the given column.
+
+    Args:
+        path (str): Path to the CSV file.
+        key (str, optional): Column that identifies a row. Defaults to "group_name".
+    Returns:
+        dict: Mapping of stripped key value to the row (dict). Rows with an empty key are skipped,
+        and if a key appears more than once the last row wins; both are warned about.
+    """
+    rows = {}
+    for line, row in enumerate(load_rows(path, key), start=2):
+        name = (row.get(key) or "").strip()
+        if not name:
+            print(f"Warning: line {line} of {path} has no {key}, ignoring it")
+            continue
+        if name in rows:
+            print(f"Warning: {key} {name} appears more than once in {path}, using line {line}")
+        rows[name] = row
+    return rows
+
+def diff_rows(old: dict, new: dict):
+    """
+    Compare two snapshots of keyed rows.
+
+    Args:
+        old (dict): Previous mapping of key to row.
+        new (dict): Current mapping of key to row.
+    Returns:
+        tuple: (added, changed, removed) where added and removed map key to row,
+        and changed maps key to an (old_row, new_row) tuple.
+    """
+    old_hashes = {k: row_hash(v) for k, v in old.items()}
+    added   = {k: v for k, v in new.items() if k not in old}
+    removed = {k: v for k, v in old.items() if k not in new}
+    changed = {k: (old[k], v) for k, v in new.items() if k in old and old_hashes[k] != row_hash(v)}
+    return added, changed, removed
+
+def _stat(path: str):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _apply(on_change, added: dict = None, changed: dict = None, removed: dict = None):
+    added, changed, removed = added or {}, changed or {}, removed or {}
+    try:
+        on_change(added, changed, removed)
+        return True
+    except Exception as e:
+        print(f"Error applying {next(iter(added or changed or removed))}: {e}")
+        return False
+
+def watch_csv(path: str, on_change, key: str = "group_name", interval: float = 1.0, retries: int = 5):
+    """
+    Watch a CSV file and call `on_change` with only the rows that were added, changed or removed.
+
+    The file as it is when watching starts is taken as the baseline, so run the full script once
+    before watching. A change is only read once the file has stopped changing for one interval, so
+    a half-written save isn't picked up. `on_change` is called once per row; if it raises, that row
+    is retried with exponential backoff (capped at a minute) up to `retries` attempts in total, after
+    which it is left alone until it is edited again. Runs until interrupted.
+
+    Args:
+        path (str): Path to the CSV file.
+        on_change (callable): Called as `on_change(added, changed, removed)`, see `diff_rows`.
+        key (str, optional): Column that identifies a row. Defaults to "group_name".
+        interval (float, optional): Seconds between checks of the file. Defaults to 1.0.
+        retries (int, optional): Attempts per row before giving up. Defaults to 5.
+    """
+    rows = read_rows(path, key)
+    last_stat = _stat(path)
+    # set when the file changed or a row failed to apply, i.e. there may be work left
+    dirty = False
+    # key -> (row hash, failed attempts, time.monotonic() of the next attempt)
+    failures = {}
+    print(f"Watching {path} ({len(rows)} rows)")
+
+    while True:
+        time.sleep(interval)
+        try:
+            stat = _stat(path)
+            if stat != last_stat:
+                # still being written, wait until it stops changing for a tick
+                last_stat = stat
+                dirty = True
+                continue
+            if not dirty:
+                continue
+            new_rows = read_rows(path, key)
+            if _stat(path) != stat:
+                continue
+            added, changed, removed = diff_rows(rows, new_rows)
+        except Exception as e:
+            # most likely a malformed save, wait for the next one
+            print(f"Could not read {path}: {e}")
+            dirty = False
+            continue
+
+        dirty = False
+        # editing a row (or re-adding a removed one) gives it a fresh set of attempts
+        for k in list(failures):
+            if failures[k][0] != (row_hash(new_rows[k]) if k in new_rows else None):
+                del failures[k]
+        if added or changed or removed:
+            print(f"{len(added)} added, {len(changed)} changed, {len(removed)} removed")
+
+        changes  = [(k, row, {"added": {k: row}}) for k, row in added.items()]
+        changes += [(k, row, {"changed": {k: (old_row, row)}}) for k, (old_row, row) in changed.items()]
+        changes += [(k, None, {"removed": {k: row}}) for k, row in removed.items()]
+
+        for k, row, change in changes:
+            _, attempts, next_try = failures.get(k, (None, 0, 0))
+            if time.monotonic() < next_try:
+                dirty = True
+                continue
+
+            if not _apply(on_change, **change):
+                attempts += 1
+                if attempts < retries:
+                    delay = min(interval * 2 ** attempts, 60)
+                    print(f"Will retry {k} in {delay:g}s (attempt {attempts + 1} of {retries})")
+                    failures[k] = (row and row_hash(row), attempts, time.monotonic() + delay)
+                    dirty = True
+                    continue
+                print(f"Giving up on {k} after {attempts} attempts, edit the row to try again")
+
+            # applied, or given up on: either way it's the new baseline for this row
+            failures.pop(k, None)
+            if row is None:
+                del rows[k]
+            else:
+                rows[k] = row